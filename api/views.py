@@ -118,7 +118,7 @@ def post(self, request):
         }
         if settings.DEBUG:
             response_data["ingredients"] = [
-                (ing.matched_food.desc_long, ing.weight) for ing in ingredient_list.all
+                (str(ing.matched_food), ing.weight) for ing in ingredient_list.all
             ]
         # Cache response
         # TODO: Add proper versioning for cache (e.g. version it using MINOR version from Semantic Versioning)
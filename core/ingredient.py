@@ -1,4 +1,6 @@
-from typing import Callable
+from typing import Callable, Iterable
+
+from django.db.models import prefetch_related_objects
 
 from core.models import FoodNutrition
 from core.search import (
@@ -14,6 +16,36 @@
     unit_to_grams,
 )
 
+# (nutrient, tagname, unit) for every nutrient included in total nutrition
+TOTAL_NUTRIENTS = tuple(
+    (nutrient, tagname, nutrient_units[nutrient])
+    for nutrient, tagname in nutrient_to_tagname.items()
+)
+TOTAL_TAGNAMES = tuple(tagname for _, tagname, _ in TOTAL_NUTRIENTS)
+
+
+def fetch_nutrients(food_ids: Iterable[int]) -> dict:
+    """Fetches values of all tracked nutrients (per 100 g) of many foods in a single query.
+
+    Args:
+        food_ids: ids of Food objects
+    Returns:
+        Dictionary with food id as a key and dictionary of tagname and value, e.g.
+        {
+            5057: {'ENERC_KCAL': 172.0, 'PROCNT': 20.85, 'SUGAR': None, ...},
+            ...
+        }
+        Tracked nutrients missing in database are mapped to None.
+    """
+    tagnames = nutrient_to_tagname.values()
+    nutrients = {food_id: dict.fromkeys(tagnames) for food_id in food_ids}
+    rows = FoodNutrition.objects.filter(
+        food_id__in=list(nutrients), tagname__in=tagnames
+    ).values_list("food_id", "tagname", "value")
+    for food_id, tagname, value in rows:
+        nutrients[food_id][tagname] = value
+    return nutrients
+
 
 class IngredientError(Exception):
     """Exception raised when creating Ingredient object fails."""
@@ -43,17 +75,9 @@ def __init__(
         :parser - parser which handles user input (ingredient name)
         """
         self.raw = ingredient_list
-        self.all = []
-        self.bad = []
-
-        ingredient_list = split_and_ingredients(ingredient_list)
-        for ing in ingredient_list:
-            try:
-                self.all.append(Ingredient(ing, parser=parser))
-            except IngredientError:
-                self.bad.append(ing)
-            except ParseIngredientError:
-                self.bad.append(ing)
+        self.all, self.bad = Ingredient.bulk_from_lines(
+            split_and_ingredients(ingredient_list), parser=parser
+        )
 
     def __iter__(self):
         return iter(self.all)
@@ -79,34 +103,14 @@ def total_nutrition(self, servings: int = 1) -> dict:
                 ...
             }
         """
-        total_nutrition = {
-            "ENERGY": 0,
-            "FAT": 0,
-            "PROTEIN": 0,
-            "CARB": 0,
-            "FAT_SAT": 0,
-            "FAT_POLY": 0,
-            "FAT_MONO": 0,
-            "SUGAR": 0,
-            "CHOLE": 0,
-            "SODIUM": 0,
-            "POTAS": 0,
-            "FIBER": 0,
+        # Rows of nutrient values (one per ingredient) reduced column by column
+        rows = [ing.calc_nutrients(TOTAL_TAGNAMES) for ing in self.all]
+        totals = map(sum, zip(*rows)) if rows else [0.0] * len(TOTAL_NUTRIENTS)
+        # Sum, round and create a tuple with value and unit in a single pass
+        return {
+            nutrient: (round(value, 2), round(value / servings, 2), unit)
+            for (nutrient, _, unit), value in zip(TOTAL_NUTRIENTS, totals)
         }
-        for ing in self.all:
-            for nutrient in total_nutrition:
-                value = ing.calc_nutrient(nutrient_to_tagname[nutrient])
-                if value:
-                    total_nutrition[nutrient] += value
-        # Round results and create a tuple with value and unit
-        for k, v in total_nutrition.items():
-            total_nutrition[k] = (
-                round(v, 2),
-                round(v / servings, 2),
-                nutrient_units[k],
-            )
-
-        return total_nutrition
 
 
 class Ingredient:
@@ -133,36 +137,102 @@ class Ingredient:
     :unit   - unit (if parsed)
     :raw_input - original string which was used to find matched_food (user input)
     :measurement - measurement (if parsed or no unit) e.g. slice, stick, batch, etc..
+    Nutrients are available as attributes named after keys of _TAG_MAP (e.g. energy, fat).
     """
 
-    def __init__(self, to_parse: str, parser: Callable[[str], dict] = parse_ingredient):
+    __slots__ = (
+        "amount",
+        "unit",
+        "measurement",
+        "name",
+        "raw_input",
+        "matched_food",
+        "weight",
+        "_nutrients",
+        "_w100",
+        "_cache",
+    )
+
+    # Attribute name and its International Network of Food Data Systems tagname
+    _TAG_MAP = {
+        "energy": "ENERC_KCAL",
+        "protein": "PROCNT",
+        "fat": "FAT",
+        "fat_sat": "FASAT",
+        "fat_poly": "FAPU",
+        "fat_mono": "FAMS",
+        "carb": "CHOCDF",
+        "sugar": "SUGAR",
+        "chol": "CHOLE",
+        "sodium": "NA",
+        "potas": "K",
+        "fiber": "FIBTG",
+    }
+
+    def __init__(
+        self,
+        to_parse: str,
+        parser: Callable[[str], dict] = parse_ingredient,
+        load_nutrients: bool = True,
+    ):
         """
         :to_parse - ingredient name
         :parser - parser which handles user input (ingredient name)
+        :load_nutrients - if False, nutrients are fetched on first use
+                          unless assigned by the caller (see bulk_from_lines)
         """
         self.amount, self.unit, self.measurement, self.name, self.raw_input = parser(
             to_parse
         ).values()
+        self._cache = {}
         self.matched_food = match_one_food(self.name)
         if not self.matched_food:
             raise IngredientError(to_parse, f"Couldn't match a food object.")
+        self._nutrients = self.get_nutrients() if load_nutrients else None
         if self.unit:
             self.weight = self.amount * unit_to_grams[self.unit]
         else:
             self.weight = self.get_weight()
+        # Nutrient values are given per 100 g, so they are scaled by this factor
+        self._w100 = self.weight * 0.01
+
+    @classmethod
+    def bulk_from_lines(
+        cls, lines: list, parser: Callable[[str], dict] = parse_ingredient
+    ) -> tuple:
+        """Creates many ingredients, fetching nutrients of all of them in a single query.
+
+        Args:
+            lines: list of ingredients (user input)
+            parser: parser which handles user input (ingredient name)
+        Returns:
+            Tuple of list of created ingredients and list of lines
+            which couldn't be parsed or matched.
+        """
+        ingredients = []
+        bad = []
+        for line in lines:
+            try:
+                ingredients.append(cls(line, parser=parser, load_nutrients=False))
+            except (IngredientError, ParseIngredientError):
+                bad.append(line)
+        nutrients = fetch_nutrients({ing.matched_food.id for ing in ingredients})
+        for ing in ingredients:
+            ing._nutrients = nutrients[ing.matched_food.id]
+        return ingredients, bad
 
     def get_weight(self) -> float:
         """
         Returns weight (in grams).
         """
-        if not self.matched_food.weight.exists():
+        # Weights are fetched once and reused by match_one_weight()
+        prefetch_related_objects([self.matched_food], "weight")
+        if not self.matched_food.weight.all():
             raise IngredientError(
                 self.matched_food, f"This food doesn't have any FoodWeight objects."
             )
         matched_weight = match_one_weight(self.matched_food, self.measurement)
-        return float(matched_weight.value) * (
-            self.amount / float(matched_weight.amount)
-        )
+        return matched_weight.value * (self.amount / matched_weight.amount)
 
     def __repr__(self):  # pragma: no cover
         return f"{self.weight:.2f} g of {self.matched_food}"
@@ -176,64 +246,64 @@ def calc_nutrient(self, tagname: str) -> float:
         Returns:
             Amount of nutrient (in it's corresponding unit) for self.weight
         """
-        nutrient = self.get_nutrient_by_tagname(tagname)
-        if not nutrient:
+        nutrients = self.nutrients
+        if tagname in nutrients:
+            value = nutrients[tagname]
+        else:
+            value = self.get_nutrient_by_tagname(tagname)
+        if value is None:
             return None
-        return float(nutrient.value) / 100 * self.weight
+        return value * self._w100
 
-    def get_nutrient_by_tagname(self, tagname: str) -> FoodNutrition:
+    def calc_nutrients(self, tagnames: tuple) -> list:
         """
-        Returns nutrient by tagname (if exists in database)
-        """
-        try:
-            return self.matched_food.nutrition.get(tagname=tagname)
-        except FoodNutrition.DoesNotExist:
-            return None
+        Calculates amounts of many nutrients at once for ingredient's weight
 
-    @property
-    def energy(self) -> float:
-        return self.calc_nutrient("ENERC_KCAL")
-
-    @property
-    def protein(self) -> float:
-        return self.calc_nutrient("PROCNT")
-
-    @property
-    def fat(self) -> float:
-        return self.calc_nutrient("FAT")
-
-    @property
-    def fat_sat(self) -> float:
-        return self.calc_nutrient("FASAT")
-
-    @property
-    def fat_poly(self) -> float:
-        return self.calc_nutrient("FAPU")
-
-    @property
-    def fat_mono(self) -> float:
-        return self.calc_nutrient("FAMS")
-
-    @property
-    def carb(self) -> float:
-        return self.calc_nutrient("CHOCDF")
+        Args:
+            tagnames: tagnames of tracked nutrients (see utils.nutrient_to_tagname)
+        Returns:
+            List of nutrient amounts in the same order as tagnames,
+            nutrients missing in database are counted as 0.0.
+        """
+        nutrients = self.nutrients
+        w100 = self._w100
+        return [(nutrients.get(tagname) or 0.0) * w100 for tagname in tagnames]
 
     @property
-    def sugar(self) -> float:
-        return self.calc_nutrient("SUGAR")
+    def nutrients(self) -> dict:
+        """Values of tracked nutrients (per 100 g), fetched if they weren't loaded yet."""
+        if self._nutrients is None:
+            self._nutrients = self.get_nutrients()
+        return self._nutrients
 
-    @property
-    def chol(self) -> float:
-        return self.calc_nutrient("CHOLE")
+    def get_nutrients(self) -> dict:
+        """
+        Returns values of all tracked nutrients (per 100 g) fetched in a single query.
 
-    @property
-    def sodium(self) -> float:
-        return self.calc_nutrient("NA")
+        Tracked nutrients missing in database are mapped to None.
+        """
+        return fetch_nutrients([self.matched_food.id])[self.matched_food.id]
 
-    @property
-    def potas(self) -> float:
-        return self.calc_nutrient("K")
+    def get_nutrient_by_tagname(self, tagname: str) -> float:
+        """
+        Returns value (per 100 g) of nutrient by tagname (if exists in database)
+        """
+        return (
+            self.matched_food.nutrition.filter(tagname=tagname)
+            .values_list("value", flat=True)
+            .first()
+        )
 
-    @property
-    def fiber(self) -> float:
-        return self.calc_nutrient("FIBTG")
+    def __getattr__(self, name):
+        """Calculates nutrient (e.g. ing.energy) on first access and caches the result."""
+        try:
+            tagname = self._TAG_MAP[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = self.calc_nutrient(tagname)
+            return value
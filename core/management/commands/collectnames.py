@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.core.management.base import BaseCommand
 from django.db import transaction
 
@@ -39,6 +40,8 @@ def handle(self, *args, **options):
             self.stdout.write("No update was applied. Names are up to date.")
         else:
             Food.objects.bulk_update(to_save, ["name", "description", "common_name"])
+            # Cached matches and recipes may refer to outdated names
+            cache.clear()
             self.stdout.write(
                 self.style.SUCCESS("Successfully updated %s food names." % len(to_save))
             )
@@ -0,0 +1,20 @@
+# Generated by Django 2.2.28 on 2026-10-14 07:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("core", "0009_auto_20190521_1502")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="foodnutrition", name="value", field=models.FloatField()
+        ),
+        migrations.AlterField(
+            model_name="foodweight", name="amount", field=models.FloatField()
+        ),
+        migrations.AlterField(
+            model_name="foodweight", name="value", field=models.FloatField()
+        ),
+    ]
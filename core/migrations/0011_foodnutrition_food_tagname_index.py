@@ -0,0 +1,17 @@
+# Generated by Django 2.2.28 on 2026-10-14 07:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("core", "0010_decimal_to_float")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="foodnutrition",
+            index=models.Index(
+                fields=["food", "tagname"], name="foodnutrition_food_tag_idx"
+            ),
+        )
+    ]
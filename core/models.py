@@ -56,9 +56,9 @@ class FoodWeight(models.Model):
     """
 
     food = models.ForeignKey(Food, on_delete=models.CASCADE, related_name="weight")
-    amount = models.DecimalField(max_digits=6, decimal_places=3)
+    amount = models.FloatField()
     desc = models.CharField(max_length=84)
-    value = models.DecimalField(max_digits=7, decimal_places=1)
+    value = models.FloatField()
 
     def __str__(self):  # pragma: no cover
         return f"{self.desc} of {self.food}"
@@ -77,9 +77,14 @@ class FoodNutrition(models.Model):
 
     food = models.ForeignKey(Food, on_delete=models.CASCADE, related_name="nutrition")
     desc = models.CharField(max_length=60)
-    value = models.DecimalField(max_digits=10, decimal_places=3)
+    value = models.FloatField()
     units = models.CharField(max_length=7)
     tagname = models.CharField(max_length=20, null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["food", "tagname"], name="foodnutrition_food_tag_idx")
+        ]
+
     def __str__(self):  # pragma: no cover
         return f"{self.tagname} of {self.food}"
@@ -2,8 +2,11 @@
 This module contains all functions that are used to
 parse user's input and match it to objects in database.
 """
+import hashlib
 from difflib import get_close_matches
+from functools import lru_cache
 
+from django.core.cache import cache
 from django.db.models import Q
 
 from core.models import Food, FoodWeight
@@ -22,6 +25,15 @@
     strip_stop_words,
 )
 
+# How long (in seconds) matched foods are kept in cache
+MATCH_CACHE_TIMEOUT = 60 * 60
+# Only fields of Food which are needed to match (and describe) it are fetched
+MATCH_FIELDS = ("id", "name", "description", "common_name")
+# Cached instead of an id for strings which didn't match any Food,
+# None can't be used as some backends (e.g. memcached) treat it as a miss
+NO_MATCH = 0
+_MISSING = object()
+
 
 class ParseIngredientError(Exception):
     """Exception raised when parsing ingredient fails."""
@@ -63,7 +75,7 @@ def match_food(string: str, n: int = 5) -> list:
     filters = Q()
     for w in string_split:
         filters = filters | Q(name__icontains=w) | Q(common_name__icontains=w)
-    food_list = Food.objects.filter(filters)
+    food_list = Food.objects.filter(filters).only(*MATCH_FIELDS)
 
     result = []
     for food in food_list:
@@ -110,34 +122,46 @@ def match_one_weight(food: Food, measurement: str) -> FoodWeight:
     Raises:
         AttributeError if Food doesn't have Weight entries.
     """
-    if not food.weight.exists():
+    # Works on a list, so weights prefetched with prefetch_related() don't hit database
+    weights = sorted(food.weight.all(), key=lambda w: w.pk)
+    if not weights:
         raise AttributeError(f"{food} has no weights.")
-    weights = food.weight.all()
     matches = get_close_matches(measurement, [w.desc for w in weights], cutoff=0.5)
-    if matches:
-        return weights.filter(desc=matches[0])[0]
     # If couldn't match default measurement then try it's varations
-    if measurement == DEFAULT_MEASUREMENT:
+    if not matches and measurement == DEFAULT_MEASUREMENT:
         for def_measurement in DEFAULT_MEASUREMENT_VARIATIONS:
             for weight in weights:
                 if def_measurement == singularize(weight.desc):
                     matches.append(weight.desc)
     if matches:
-        return weights.filter(desc=matches[0])[0]
+        return next(w for w in weights if w.desc == matches[0])
     else:
-        return food.weight.last()
+        return weights[-1]
 
 
 def match_one_food(string: str) -> Food:
     """Wrapper for match_food(). Returns only one Food object.
 
+    Id of matched Food is cached, so repeated strings are resolved
+    with a primary key lookup instead of scoring all candidates again.
+
     Args:
         string: A string to be matched with Food.
     Returns:
         Food object.
     """
+    key = "match_one_food:" + hashlib.sha256(string.casefold().encode()).hexdigest()
+    food_id = cache.get(key, default=_MISSING)
+    if food_id == NO_MATCH:
+        return None
+    if food_id is not _MISSING:
+        food = Food.objects.filter(id=food_id).only(*MATCH_FIELDS).first()
+        if food:
+            return food
     res = match_food(string, n=1)
-    return res[0][0] if res else None
+    food = res[0][0] if res else None
+    cache.set(key, food.id if food else NO_MATCH, MATCH_CACHE_TIMEOUT)
+    return food
 
 
 def parse_ingredient(string: str) -> dict:
@@ -155,9 +179,11 @@ def parse_ingredient(string: str) -> dict:
     Raises:
         ValueError: When string is empty.
     """
-    return naive_parse_ingredient(string)
+    # Results of the parser are cached, return a copy so they can't be modified
+    return dict(naive_parse_ingredient(string))
 
 
+@lru_cache(maxsize=4096)
 def naive_parse_ingredient(string: str) -> dict:
     """Parses string and returns unit, amount, measurement and name of ingredient
 
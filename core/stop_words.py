@@ -486,7 +486,7 @@
     "sufficiently",
     "suggest",
     "sup",
-    "sure\tt",
+    "sure",
     "take",
     "taken",
     "taking",
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from core.ingredient import Ingredient, IngredientError, IngredientList
 from core.models import Food, FoodNutrition, FoodWeight
@@ -48,6 +50,65 @@ def test_food_with_no_nutrients(self):
         food = Ingredient(food.name)
         assert food.energy is None
 
+    def test_nutrients_are_fetched_once(self, django_assert_num_queries):
+        """Ensure that accessing nutrients doesn't query database for every nutrient"""
+        food = Food.objects.create(name="Chicken")
+        FoodNutrition.objects.create(
+            food=food, desc="Proteins", value=5, units="g", tagname="PROCNT"
+        )
+        ing = Ingredient("100 g chicken")
+        with django_assert_num_queries(0):
+            assert ing.protein == 5.0
+            assert ing.energy is None
+
+    def test_bulk_from_lines(self):
+        """Ensure that bulk_from_lines fetches nutrients of all ingredients in one query"""
+        chicken = Food.objects.create(name="Chicken")
+        apple = Food.objects.create(name="Apple")
+        FoodNutrition.objects.create(
+            food=chicken, desc="Proteins", value=5, units="g", tagname="PROCNT"
+        )
+        FoodNutrition.objects.create(
+            food=apple, desc="Proteins", value=1, units="g", tagname="PROCNT"
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            ings, bad = Ingredient.bulk_from_lines(
+                ["100 g chicken", "50 g apple", "xyz"]
+            )
+        nutrition_queries = [
+            q for q in ctx.captured_queries if "core_foodnutrition" in q["sql"]
+        ]
+        assert len(nutrition_queries) == 1
+        assert bad == ["xyz"]
+        assert [ing.protein for ing in ings] == [5.0, 0.5]
+
+    def test_calc_untracked_nutrient(self):
+        """Ensure that nutrients not fetched with the tracked ones are still calculated"""
+        food = Food.objects.create(name="Chicken")
+        FoodNutrition.objects.create(
+            food=food, desc="Vitamin C", value=2, units="mg", tagname="VITC"
+        )
+        ing = Ingredient("50 g chicken")
+        assert ing.get_nutrient_by_tagname("VITC") == 2.0
+        assert ing.calc_nutrient("VITC") == 1.0
+        assert ing.calc_nutrient("VITD") is None
+
+    def test_nutrients_loaded_on_first_use(self):
+        """Ensure that ingredient created without nutrients fetches them when needed"""
+        food = Food.objects.create(name="Chicken")
+        FoodNutrition.objects.create(
+            food=food, desc="Proteins", value=5, units="g", tagname="PROCNT"
+        )
+        ing = Ingredient("100 g chicken", load_nutrients=False)
+        assert ing.calc_nutrients(("PROCNT", "FAT")) == [5.0, 0.0]
+
+    def test_unknown_attribute(self):
+        """Ensure that only known nutrients are resolved as attributes"""
+        Food.objects.create(name="Chicken")
+        ing = Ingredient("100 g chicken")
+        with pytest.raises(AttributeError):
+            assert ing.not_a_nutrient
+
     def test_parsing_non_existent_ingredient(self):
         with pytest.raises(IngredientError):
             assert Ingredient("xyz")
@@ -57,6 +118,19 @@ def test_assign_weight(self):
         ing = Ingredient("1 g of chicken breast")
         assert ing.weight == 1
 
+    def test_weights_are_fetched_once(self):
+        """Ensure that matching a weight queries FoodWeight only once"""
+        food = Food.objects.create(name="Chicken breast")
+        FoodWeight.objects.create(food=food, amount=1, desc="piece", value=120)
+        FoodWeight.objects.create(food=food, amount=2, desc="cup", value=280)
+        with CaptureQueriesContext(connection) as ctx:
+            ing = Ingredient("2 pieces of chicken breast")
+        weight_queries = [
+            q for q in ctx.captured_queries if "core_foodweight" in q["sql"]
+        ]
+        assert len(weight_queries) == 1
+        assert ing.weight == 240
+
     def test_raise_when_no_weight(self):
         Food.objects.create(name="Chicken breast")
         with pytest.raises(IngredientError):
@@ -116,6 +190,12 @@ def test_add_to_bad_when_ParseIngredientError(self):
 
         assert ings.bad == ["$$"]
 
+    def test_total_nutrition_of_empty_list(self):
+        """Ensure that total nutrition of no ingredients is all zeros"""
+        total_nutrition = IngredientList([]).total_nutrition()
+        assert all(value[:2] == (0.0, 0.0) for value in total_nutrition.values())
+        assert isinstance(total_nutrition["ENERGY"][0], float)
+
     def test_if_ingredient_list_behaves_like_list(self):
         """Ensure that IngredientList behaves like a list."""
         ings = IngredientList([])
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from core.models import Food, FoodNutrition, FoodWeight
 from core.search import (
@@ -39,6 +41,20 @@ def test_match_one_food(self):
         assert match_one_food("chicken").id == food.id
         assert match_one_food("") is None
 
+    def test_match_one_food_is_cached(self):
+        """Ensure that match_one_food reuses previously matched Food"""
+        food = Food.objects.create(name="Chicken")
+        assert match_one_food("chicken").id == food.id
+        Food.objects.create(name="Chicken", common_name="Chicken")
+        assert match_one_food("chicken").id == food.id
+
+    def test_match_one_food_caches_no_match(self):
+        """Ensure that strings which didn't match any Food aren't matched again"""
+        assert match_one_food("xyz") is None
+        with CaptureQueriesContext(connection) as ctx:
+            assert match_one_food("xyz") is None
+        assert not [q for q in ctx.captured_queries if "core_food" in q["sql"]]
+
     def test_common_name_prevalence(self):
         Food.objects.create(name="Salt")
         food2 = Food.objects.create(name="Salt", common_name="Salt")
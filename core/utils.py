@@ -78,9 +78,6 @@
     "FAT": "g",
     "PROTEIN": "g",
     "CARB": "g",
-    "FAT_KCAL": "kcal",
-    "PROTEIN_KCAL": "kcal",
-    "CARB_KCAL": "kcal",
     "FAT_SAT": "g",
     "FAT_POLY": "g",
     "FAT_MONO": "g",
@@ -172,9 +169,6 @@
 
 all_units = {unit for tup in units.values() for unit in tup}
 
-stop_words_re = "|".join(stop_words)
-stop_words_re = r"(?<!\S)(" + stop_words_re + r")(?!\S)"
-
 wnl = WordNetLemmatizer()
 wnl.lemmatize("", "n")  # Call with dummy data to make nltk load WordNet on start
 
@@ -222,12 +216,15 @@ def strip_special_chars(string: str, whitelist: list = ["%", "/", "\\-", "'"]) -
 def strip_stop_words(string: str) -> str:
     """Removes all stop words from a string.
 
+    Words are looked up in a set, which is linear in length of the string
+    (alternation of all stop words in a regex was tried at every position).
+
     Args:
         string: A string to be stripped.
     Returns:
         Stripped string.
     """
-    return trim_whitespaces(re.sub(stop_words_re, "", f" {string} "))
+    return " ".join(word for word in string.split() if word not in stop_words)
 
 
 def translate(string: str, from_lang: str = None) -> str: